@@ -0,0 +1,9 @@
+"""Application wide flask-caching cache.
+
+The cache is created unbound so that components and pages can import
+it without importing the Dash app. main binds it to the flask server
+with cache.init_app at startup.
+"""
+from flask_caching import Cache
+
+cache = Cache(config={"CACHE_TYPE": "SimpleCache", "CACHE_DEFAULT_TIMEOUT": 300})
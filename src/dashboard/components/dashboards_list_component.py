@@ -4,11 +4,14 @@ from datetime import datetime
 
 from dash.dependencies import Component
 
+from dashboard.cache import cache
 from dashboard.models.user import Dashboard
 from dashboard.utilities import to_human_time_delta
 
 from .list_component import list_component
 
+LIST_TITLES = ("Title", "Last edited at", "Created at")
+
 
 def generate_list_row_contents(time: datetime, dashboard: Dashboard) -> list[str]:
     """Generate list row from a Dashboard model.
@@ -30,6 +33,25 @@ def generate_list_row_contents(time: datetime, dashboard: Dashboard) -> list[str
     ]
 
 
+@cache.memoize()
+def _cached_list_component(list_rows: tuple[tuple[str, ...], ...], _id: str) -> Component:
+    """Build a list component, memoized on its row contents.
+
+    Repeated visits with unchanged rows return the cached component
+    tree instead of regenerating every row element. The rows are
+    tuples so they can act as the cache key.
+
+    Args:
+        list_rows (tuple[tuple[str, ...], ...]): The rows that make
+        up the list contents.
+        _id (str): The component id of the list.
+
+    Returns:
+        Component: A dashboards list component.
+    """
+    return list_component(list(LIST_TITLES), [list(row) for row in list_rows], _id)
+
+
 def dashboards_list_component(dashboards: list[Dashboard], _id: str) -> Component:
     """Create a dashboards list component.
 
@@ -48,8 +70,7 @@ def dashboards_list_component(dashboards: list[Dashboard], _id: str) -> Componen
     """
     now = datetime.now()
 
-    return list_component(
-        ["Title", "Last edited at", "Created at"],
-        [generate_list_row_contents(now, dashboard) for dashboard in dashboards],
+    return _cached_list_component(
+        tuple(tuple(generate_list_row_contents(now, dashboard)) for dashboard in dashboards),
         _id,
     )
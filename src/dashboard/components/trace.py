@@ -2,9 +2,16 @@
 
 from enum import Enum
 
+import numpy as np
 import plotly.graph_objs as go
 import polars as pl
 
+HISTOGRAM_BINS = 50
+
+# Line and scatter traces are downsampled to at most this many points
+# before being handed to Plotly.
+DOWNSAMPLE_THRESHOLD = 5000
+
 
 class TraceType(Enum):
     """Contains the available trace types."""
@@ -12,6 +19,67 @@ class TraceType(Enum):
     LINE = "lines"
     SCATTER = "markers"
     BAR = "bar"
+    HISTOGRAM = "histogram"
+
+
+def _lttb(
+    xs: np.ndarray, ys: np.ndarray, n_out: int = DOWNSAMPLE_THRESHOLD
+) -> tuple[np.ndarray, np.ndarray]:
+    """Downsample a series with largest-triangle-three-buckets.
+
+    Keeps the first and last points and picks, per bucket, the point
+    spanning the largest triangle with the previously kept point and
+    the next bucket's average, which preserves peaks and the visual
+    shape of the series.
+
+    Args:
+        xs (np.ndarray): The x values, assumed ordered.
+        ys (np.ndarray): The y values.
+        n_out (int, optional): The number of points to keep.
+            Defaults to DOWNSAMPLE_THRESHOLD.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The downsampled x and y
+        values, or the input unchanged if it already fits.
+    """
+    n = len(xs)
+    if n <= n_out:
+        return xs, ys
+
+    xs = xs.astype(np.float64)
+    ys = ys.astype(np.float64)
+
+    # Bucket boundaries for the interior points; the endpoints each
+    # get a bucket of their own.
+    bounds = np.linspace(1, n - 1, n_out - 1).astype(np.int64)
+    indices = np.empty(n_out, dtype=np.int64)
+    indices[0] = 0
+    indices[-1] = n - 1
+
+    prev = 0
+    for i in range(n_out - 2):
+        start, stop = bounds[i], bounds[i + 1]
+        if stop <= start:
+            prev = start
+            indices[i + 1] = prev
+            continue
+
+        next_stop = bounds[i + 2] if i + 2 < n_out - 1 else n
+        if next_stop > stop:
+            avg_x = float(xs[stop:next_stop].mean())
+            avg_y = float(ys[stop:next_stop].mean())
+        else:
+            avg_x = float(xs[stop])
+            avg_y = float(ys[stop])
+
+        areas = np.abs(
+            (xs[prev] - avg_x) * (ys[start:stop] - ys[prev])
+            - (xs[prev] - xs[start:stop]) * (avg_y - ys[prev])
+        )
+        prev = start + int(areas.argmax())
+        indices[i + 1] = prev
+
+    return xs[indices], ys[indices]
 
 
 def trace(
@@ -19,7 +87,7 @@ def trace(
     trace_type: TraceType,
     trace_color: str,
     name: str,
-) -> go.Scatter | go.Bar:
+) -> go.Scattergl | go.Bar:
     """Creates a trace based on a trace type.
 
     A trace can not be used as an html element
@@ -39,36 +107,108 @@ def trace(
         name (str): The name of the trace.
 
     Returns:
-        go.Scatter | go.Bar: The created trace.
+        go.Scattergl | go.Bar: The created trace.
     """
-    cols = df.columns
     if df is None:
-        return go.Scatter()
-
-    if trace_type == TraceType.LINE:
-        return go.Scatter(
-            x=df[cols[0]],
-            y=df[cols[1]],
-            marker_color=trace_color,
-            mode=trace_type.value,
-            name=name,
-        )
-
-    if trace_type == TraceType.SCATTER:
-        return go.Scatter(
-            x=df[cols[0]],
-            y=df[cols[1]],
-            marker_color=trace_color,
-            mode=trace_type.value,
-            name=name,
-        )
+        return go.Scattergl()
 
-    if trace_type == TraceType.BAR:
-        return go.Bar(
-            x=df[cols[0]],
-            y=df[cols[1]],
-            marker_color=trace_color,
-            name=name,
-        )
-
-    return go.Scatter()
+    cols = df.columns
+    # Hand Plotly NumPy views of the columns instead of the Polars
+    # Series themselves. Serializing a Series boxes every value into a
+    # Python object, while a NumPy array is consumed as one contiguous
+    # buffer.
+    xs = df[cols[0]].to_numpy()
+    ys = df[cols[1]].to_numpy()
+
+    builder = _TRACE_BUILDERS.get(trace_type)
+    if builder is None:
+        return go.Scattergl()
+
+    # Cap line and scatter traces at DOWNSAMPLE_THRESHOLD points; the
+    # browser cannot usefully display more and both the payload and
+    # the render cost scale with the point count.
+    if (
+        trace_type in (TraceType.LINE, TraceType.SCATTER)
+        and len(xs) > DOWNSAMPLE_THRESHOLD
+        and np.issubdtype(xs.dtype, np.number)
+        and np.issubdtype(ys.dtype, np.number)
+    ):
+        xs, ys = _lttb(xs, ys)
+
+    return builder(xs, ys, trace_color, name)
+
+
+def _line_trace(xs: np.ndarray, ys: np.ndarray, trace_color: str, name: str) -> go.Scattergl:
+    """Build a line trace.
+
+    Scattergl renders through WebGL on the client, which batches draw
+    calls and stays responsive for much larger uploads than the
+    default svg renderer.
+    """
+    return go.Scattergl(
+        x=xs,
+        y=ys,
+        marker_color=trace_color,
+        mode=TraceType.LINE.value,
+        name=name,
+    )
+
+
+def _scatter_trace(xs: np.ndarray, ys: np.ndarray, trace_color: str, name: str) -> go.Scattergl:
+    """Build a scatter trace. Rendered via WebGL, see _line_trace."""
+    return go.Scattergl(
+        x=xs,
+        y=ys,
+        marker_color=trace_color,
+        mode=TraceType.SCATTER.value,
+        name=name,
+    )
+
+
+def _bar_trace(xs: np.ndarray, ys: np.ndarray, trace_color: str, name: str) -> go.Bar:
+    """Build a bar trace."""
+    return go.Bar(
+        x=xs,
+        y=ys,
+        marker_color=trace_color,
+        name=name,
+    )
+
+
+def _histogram_trace(xs: np.ndarray, ys: np.ndarray, trace_color: str, name: str) -> go.Bar:
+    """Build a histogram trace.
+
+    Bins serverside so the client receives O(bins) values instead of
+    the raw column, which Plotly would otherwise ship in full just to
+    bin it again in the browser.
+    """
+    # np.histogram cannot bin non-numeric values; fall back to an
+    # empty trace like unknown trace types do instead of crashing the
+    # callback on e.g. a text first column.
+    if not np.issubdtype(xs.dtype, np.number):
+        return go.Bar()
+
+    # Polars nulls arrive as NaN (an integer column with one null
+    # comes back as float64), and np.histogram cannot autodetect a
+    # range from NaNs, so bin only the present values.
+    xs = xs[~np.isnan(xs)]
+    if len(xs) == 0:
+        return go.Bar()
+
+    counts, edges = np.histogram(xs, bins=HISTOGRAM_BINS)
+    return go.Bar(
+        x=(edges[:-1] + edges[1:]) / 2,
+        y=counts,
+        marker_color=trace_color,
+        name=name,
+    )
+
+
+# Dispatch table mapping each trace type to its builder, constructed
+# once at import instead of walking an if-chain per trace.
+_TRACE_BUILDERS = {
+    TraceType.LINE: _line_trace,
+    TraceType.SCATTER: _scatter_trace,
+    TraceType.BAR: _bar_trace,
+    TraceType.HISTOGRAM: _histogram_trace,
+}
@@ -4,31 +4,79 @@ import functools
 from io import BytesIO
 from typing import Any, Callable, Tuple
 
-from dash import Input, Output, Patch, State, callback, ctx, dcc
+from dash import (
+    DiskcacheManager,
+    Input,
+    Output,
+    Patch,
+    State,
+    callback,
+    clientside_callback,
+    ctx,
+    dcc,
+)
 from dash.exceptions import PreventUpdate
+import diskcache
 import plotly.graph_objs as go
-import polars as pl
 
 from dashboard.components import trace
 from dashboard.components.trace import TraceType
-from dashboard.utilities import convert_to_dataframes
+from dashboard.utilities import convert_to_dataframes, deserialize_dataframe, serialize_dataframe
+
+# Manager for background callbacks. Runs the decorated callback in a
+# separate process and hands the result back through a local diskcache
+# directory, so uploads do not block the request workers.
+background_callback_manager = DiskcacheManager(diskcache.Cache("./cache"))
+
+# Debounce the graph type radio buttons. Each click cancels the
+# previous pending timer, so a burst of clicks resolves into a single
+# store write 150 ms after the last one, and patch_graph_type runs
+# once instead of once per click.
+clientside_callback(
+    """
+    function (value) {
+        if (window._debouncedGraphType) {
+            window._debouncedGraphType(window.dash_clientside.no_update);
+        }
+        return new Promise((resolve) => {
+            const timer = setTimeout(() => {
+                window._debouncedGraphType = null;
+                resolve(value);
+            }, 150);
+            window._debouncedGraphType = (early) => {
+                clearTimeout(timer);
+                resolve(early);
+            };
+        });
+    }
+    """,
+    Output("debounced_graph_type", "data"),
+    Input("choose_graph_type", "value"),
+    prevent_initial_call=True,
+)
 
 
 @callback(
     Output("graph_id", "figure", allow_duplicate=True),
-    Input("choose_graph_type", "value"),
+    Input("debounced_graph_type", "data"),
+    State("uploaded_dataframes", "data"),
     State("graph_id", "figure"),
     State("graph_selector", "value"),
     State("graph_name", "value"),
     prevent_initial_call=True,
 )
 def patch_graph_type(
-    graph_type: str, graph_data: dict[str, list[Any]], i: int, graph_name: str
+    graph_type: str,
+    stored_frames: list[str],
+    graph_data: dict[str, list[Any]],
+    i: int,
+    graph_name: str,
 ) -> Patch:
     """A patched figure object that patches the graph type.
 
     Args:
         graph_type (str): The new graph type
+        stored_frames (list[str]): Serialized uploaded dataframes
         graph_data (_type_): Current graph data
         i (int): Graph index
 
@@ -40,10 +88,10 @@ def patch_graph_type(
     except ValueError as err:
         raise PreventUpdate from err
 
-    if "data" not in graph_data:
+    if not stored_frames or "data" not in graph_data:
         raise PreventUpdate
 
-    data_frame = pl.DataFrame({"x": graph_data["data"][i]["x"], "y": graph_data["data"][i]["y"]})
+    data_frame = deserialize_dataframe(stored_frames[i])
     color = graph_data["data"][i]["marker"]
     patched_figure = Patch()
     patched_figure["data"][i] = trace(data_frame, trace_type, color["color"], graph_name)
@@ -184,21 +232,36 @@ def patch_axis_names(x: str, y: str) -> Patch:
     Output("graph_selector", "options"),
     Output("graph_selector", "value"),
     Output("graph_name", "disabled"),
+    Output("uploaded_dataframes", "data"),
     Input("uploaded_data", "contents"),
+    background=True,
+    running=[
+        (Output("create-graph", "disabled"), True, False),
+        (Output("cancel-graph", "disabled"), True, False),
+    ],
+    manager=background_callback_manager,
     prevent_initial_call=True,
 )
 def render_figure(
     contents: list[str],
-) -> Tuple[go.Figure, list[dict[str, str | int]], int, bool]:
+) -> Tuple[go.Figure, list[dict[str, str | int]], int, bool, list[str]]:
     """Renders the figure using CSV-files.
 
     Returns:
         dcc.Graph: Graph to be rendered
         list[dict[str: str]]: list of all the graph names
+        list[str]: the parsed dataframes, serialized for the store
     """
-    created_figs: list[go.Scatter | go.Bar] = []
+    # Safety net: prevent_initial_call already stops the page-mount
+    # invocation, but a cleared upload would still arrive as None.
+    if contents is None:
+        raise PreventUpdate
+
+    created_figs: list[go.Scattergl | go.Bar] = []
     figure_names: list[dict[str, str | int]] = []
-    data_frames = convert_to_dataframes(contents)
+    # Only the first two columns are ever plotted, so project the
+    # parse down to them instead of materializing every column.
+    data_frames = convert_to_dataframes(contents, columns=(0, 1))
 
     for num, df in enumerate(data_frames):
         loc_fig = trace(df, TraceType.LINE, "#000000", name=f"Graph {num}")
@@ -215,4 +278,4 @@ def render_figure(
         ),
     )
 
-    return fig, figure_names, 0, False
+    return fig, figure_names, 0, False, [serialize_dataframe(df) for df in data_frames]
@@ -20,23 +20,15 @@ debug = True
 
 event = {"event": "click", "props": ["scatter", "line"]}
 
-
-# the main graphical component for the entire csv graph create page page
-def layout() -> Component:
-    """Main layout component that is parent to all other components.
-
-    Returns:
-        A html.div component with all other components.
-    """
-    # main background element
-    return html.Div(
-        className="bg-background flex h-screen",
-        children=[
-            graph_window(),
-            right_settings_bar(),
-            dcc.Download(id="download_fig"),
-        ],
-    )
+# Shared Tailwind classnames, assembled once at import instead of being
+# repeated (or rebuilt) at every call site.
+MENU_BUTTON_CLASSNAME = "bg-menu-back hover:bg-dark-purple justify-center flex-1"
+DOWNLOAD_BUTTON_CLASSNAME = MENU_BUTTON_CLASSNAME + " text-white text-xs font-bold"
+RADIO_ITEM_CLASSNAME = (
+    "peer-checked:opacity-100 peer-checked:shadow-lg peer-checked:bg-[#03c04a] "
+    "peer-checked:text-[#2f3273] flex flex-col items-center p-3 cursor-pointer "
+    "bg-[#636af2] rounded-md shadow-md duration-150 hover:bg-[#2F3273] text-white"
+)
 
 
 def csv_button() -> Component:
@@ -49,6 +41,7 @@ def csv_button() -> Component:
         className="bg-menu-back duration-150 shrink flex flex-col "
         "cursor-pointer p-3 mr-2 rounded-md hover:bg-dark-purple",
         id="uploaded_data",
+        accept=".csv,.parquet",
         children=button(
             "upload", "CSV file", size=26, className="whitespace-nowrap bg-transparent"
         ),
@@ -72,8 +65,7 @@ def download_button(icon: str, text: str, id: str) -> html.Button:
         icon_name=icon,
         text=text,
         id=id,
-        className="bg-menu-back hover:bg-dark-purple justify-center flex-1 "
-        "text-white text-xs font-bold",
+        className=DOWNLOAD_BUTTON_CLASSNAME,
     )
 
 
@@ -198,7 +190,7 @@ def upload_buttons() -> html.Div:
                         "database",
                         "Database",
                         size=18,
-                        className="bg-menu-back hover:bg-dark-purple justify-center flex-1",
+                        className=MENU_BUTTON_CLASSNAME,
                     ),
                 ],
             ),
@@ -222,6 +214,7 @@ def radio_buttons() -> html.Div:
                     radio_item("Line", TraceType.LINE.value, "show_chart"),
                     radio_item("Bar", TraceType.BAR.value, "bar_chart"),
                     radio_item("Scatter", TraceType.SCATTER.value, "scatter_plot"),
+                    radio_item("Histogram", TraceType.HISTOGRAM.value, "equalizer"),
                 ],
                 inputClassName="peer hidden",
                 value=TraceType.LINE.value,
@@ -278,12 +271,31 @@ def radio_item(name: str, value: str, icon_name: str) -> dict[str, html.Div | st
         dict[str, html.Div]: Dictionary containing label and
         values required for dcc.RadioItems
     """
-    classname = (
-        "peer-checked:opacity-100 peer-checked:shadow-lg peer-checked:bg-[#03c04a] "
-        "peer-checked:text-[#2f3273] flex flex-col items-center p-3 cursor-pointer "
-        "bg-[#636af2] rounded-md shadow-md duration-150 hover:bg-[#2F3273] text-white"
-    )
     return {
-        "label": html.Div(className=classname, children=[icon(icon_name, size=40), html.P(name)]),
+        "label": html.Div(
+            className=RADIO_ITEM_CLASSNAME, children=[icon(icon_name, size=40), html.P(name)]
+        ),
         "value": value,
     }
+
+
+# The main graphical component for the entire csv graph create page.
+# Nothing in the tree depends on request state, so it is built once at
+# import time instead of on every page load; the dynamic parts are all
+# filled in by callbacks.
+layout = html.Div(
+    # main background element
+    className="bg-background flex h-screen",
+    children=[
+        graph_window(),
+        right_settings_bar(),
+        dcc.Download(id="download_fig"),
+        # Holds the uploaded dataframes as Arrow IPC strings so
+        # graph-type changes do not have to re-parse the csv data.
+        dcc.Store(id="uploaded_dataframes", storage_type="memory"),
+        # Debounced mirror of the choose_graph_type radio, written by
+        # a clientside callback so rapid clicks collapse into a single
+        # figure rebuild.
+        dcc.Store(id="debounced_graph_type", storage_type="memory"),
+    ],
+)
@@ -1,6 +1,9 @@
 """Module with utility functions that are reused frequently."""
 import base64
 from datetime import timedelta
+import functools
+import io
+from typing import cast
 
 import polars as pl
 
@@ -122,13 +125,19 @@ def to_human_time_delta(duration: timedelta, abbreviated: bool = False) -> str:
     return "Just now"
 
 
-def convert_to_dataframes(contents: list[str]) -> list[pl.DataFrame]:
+def convert_to_dataframes(
+    contents: list[str], columns: tuple[int, ...] | tuple[str, ...] | None = None
+) -> list[pl.DataFrame]:
     """Convert contents from csv files to polars dataframes.
 
     Args:
         contents (list[str]): The string contents of the uploaded
         csv files, each containing the file data type and data
         seperated by a comma.
+        columns (tuple[int, ...] | tuple[str, ...], optional): Column
+        indices or names to project during the parse. Columns not
+        listed are never materialized. Defaults to None, which keeps
+        every column.
 
     Returns:
         list[pl.DataFrame]: The polars dataframes. No entry is made
@@ -137,7 +146,7 @@ def convert_to_dataframes(contents: list[str]) -> list[pl.DataFrame]:
     dataframes: list[pl.DataFrame] = []
     for c in contents:
         try:
-            df = convert_to_dataframe(c)
+            df = convert_to_dataframe(c, columns)
         except ValueError:
             continue
 
@@ -146,13 +155,18 @@ def convert_to_dataframes(contents: list[str]) -> list[pl.DataFrame]:
     return dataframes
 
 
-def convert_to_dataframe(contents: str) -> pl.DataFrame:
+def convert_to_dataframe(
+    contents: str, columns: tuple[int, ...] | tuple[str, ...] | None = None
+) -> pl.DataFrame:
     """Convert contents from csv file to polars dataframe.
 
     Args:
         contents (str): The string contents of the uploaded
         csv file, containing the data type and data seperated
         by a comma.
+        columns (tuple[int, ...] | tuple[str, ...], optional): Column
+        indices or names to project during the parse. Defaults to
+        None, which keeps every column.
 
     Raises:
         ValueError: If the contents of the csv file is incorrectly
@@ -164,7 +178,75 @@ def convert_to_dataframe(contents: str) -> pl.DataFrame:
         pl.DataFrame: The polars dataframe if the file contents is
         valid, else None.
     """
-    content_type, contents_data = contents.split(",")
+    # Only split off the data url prefix; scanning the whole base64
+    # payload for further commas is wasted work on large uploads.
+    content_type, contents_data = contents.split(",", 1)
+
+    return _decode_and_parse(contents_data, columns)
+
+
+def serialize_dataframe(df: pl.DataFrame) -> str:
+    """Serialize a dataframe to a base64 encoded Arrow IPC string.
+
+    The Arrow IPC format preserves the columnar layout and dtypes of
+    the dataframe, making it far cheaper to round-trip through a
+    dcc.Store than json.
+
+    Args:
+        df (pl.DataFrame): The dataframe to serialize.
+
+    Returns:
+        str: The base64 encoded Arrow IPC data.
+    """
+    return base64.b64encode(df.write_ipc(None).getvalue()).decode()
+
+
+def deserialize_dataframe(data: str) -> pl.DataFrame:
+    """Deserialize a dataframe from a base64 encoded Arrow IPC string.
+
+    Args:
+        data (str): Data produced by serialize_dataframe.
+
+    Returns:
+        pl.DataFrame: The deserialized polars dataframe.
+    """
+    return pl.read_ipc(io.BytesIO(base64.b64decode(data)))
+
+
+@functools.lru_cache(maxsize=8)
+def _decode_and_parse(
+    contents_data: str, columns: tuple[int, ...] | tuple[str, ...] | None = None
+) -> pl.DataFrame:
+    """Decode base64 file data and parse it as parquet or csv.
+
+    The actual file type is detected from the magic bytes of the
+    decoded data rather than the filename. Parquet files carry their
+    own schema and columnar layout, so reading them skips text
+    parsing entirely; anything else is treated as csv, as before.
+
+    The result is memoized on the base64 payload, so re-uploading
+    or re-rendering the same file skips the decode and parse
+    entirely.
+
+    Args:
+        contents_data (str): The base64 encoded file data.
+        columns (tuple[int, ...] | tuple[str, ...], optional): Column
+        indices or names to project during the parse. A tuple rather
+        than a list so the call is hashable for the cache. Defaults
+        to None.
+
+    Returns:
+        pl.DataFrame: The parsed polars dataframe.
+    """
     decoded = base64.b64decode(contents_data)
 
-    return pl.read_csv(decoded)
+    # The tuple is homogeneous per the signature, but mypy cannot
+    # carry that through list(), so narrow the projection explicitly.
+    projection = cast(
+        "list[int] | list[str] | None", list(columns) if columns is not None else None
+    )
+
+    if decoded[:4] == b"PAR1":
+        return pl.read_parquet(io.BytesIO(decoded), columns=projection)
+
+    return pl.read_csv(decoded, columns=projection)
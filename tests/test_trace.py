@@ -0,0 +1,79 @@
+"""Tests for the trace component."""
+import plotly.graph_objs as go
+import polars as pl
+import pytest
+
+from dashboard.components.trace import (
+    DOWNSAMPLE_THRESHOLD,
+    HISTOGRAM_BINS,
+    TraceType,
+    _lttb,
+    trace,
+)
+
+DF = pl.DataFrame({"x": list(range(100)), "y": list(range(100))})
+LARGE_DF = pl.DataFrame(
+    {"x": list(range(DOWNSAMPLE_THRESHOLD * 4)), "y": list(range(DOWNSAMPLE_THRESHOLD * 4))}
+)
+
+
+@pytest.mark.test_trace
+class TestTrace:
+    """Collection of tests for the trace function."""
+
+    def test_line_and_scatter_use_webgl(self) -> None:
+        """Test that line and scatter traces render through WebGL."""
+        assert isinstance(trace(DF, TraceType.LINE, "#000000", "Graph 0"), go.Scattergl)
+        assert isinstance(trace(DF, TraceType.SCATTER, "#000000", "Graph 0"), go.Scattergl)
+
+    def test_histogram_is_binned_serverside(self) -> None:
+        """Test that histogram traces only carry bin aggregates."""
+        tr = trace(DF, TraceType.HISTOGRAM, "#000000", "Graph 0")
+        assert isinstance(tr, go.Bar)
+        assert len(tr.x) == HISTOGRAM_BINS
+        assert sum(tr.y) == len(DF)
+
+    def test_histogram_of_text_column_is_empty(self) -> None:
+        """Test that a non-numeric column gives an empty histogram."""
+        df = pl.DataFrame({"x": ["a", "b", "a"], "y": [1, 2, 3]})
+        tr = trace(df, TraceType.HISTOGRAM, "#000000", "Graph 0")
+        assert isinstance(tr, go.Bar)
+        assert tr.x is None
+
+    def test_histogram_skips_null_cells(self) -> None:
+        """Test that null cells are dropped before binning."""
+        df = pl.DataFrame({"x": [1, None, 3], "y": [1, 2, 3]})
+        tr = trace(df, TraceType.HISTOGRAM, "#000000", "Graph 0")
+        assert isinstance(tr, go.Bar)
+        assert sum(tr.y) == 2
+
+    def test_histogram_of_all_null_column_is_empty(self) -> None:
+        """Test that an all-null column gives an empty histogram."""
+        df = pl.DataFrame({"x": pl.Series([None, None], dtype=pl.Float64), "y": [1, 2]})
+        tr = trace(df, TraceType.HISTOGRAM, "#000000", "Graph 0")
+        assert isinstance(tr, go.Bar)
+        assert tr.x is None
+
+    def test_large_traces_are_downsampled(self) -> None:
+        """Test that oversized line traces are capped."""
+        tr = trace(LARGE_DF, TraceType.LINE, "#000000", "Graph 0")
+        assert len(tr.x) == DOWNSAMPLE_THRESHOLD
+
+    def test_small_traces_are_untouched(self) -> None:
+        """Test that traces below the threshold keep every point."""
+        tr = trace(DF, TraceType.LINE, "#000000", "Graph 0")
+        assert len(tr.x) == len(DF)
+
+
+@pytest.mark.test_trace
+class TestLttb:
+    """Collection of tests for the _lttb downsampler."""
+
+    def test_keeps_endpoints(self) -> None:
+        """Test that the first and last points survive downsampling."""
+        xs = LARGE_DF["x"].to_numpy()
+        ys = LARGE_DF["y"].to_numpy()
+        out_xs, out_ys = _lttb(xs, ys)
+        assert len(out_xs) == len(out_ys) == DOWNSAMPLE_THRESHOLD
+        assert out_xs[0] == xs[0]
+        assert out_xs[-1] == xs[-1]
@@ -1,10 +1,16 @@
 """Tests for the utilities module."""
+import base64
 from datetime import datetime, timedelta
+import io
 
+import polars as pl
 import pytest
 
 from dashboard.utilities import (
+    convert_to_dataframe,
+    deserialize_dataframe,
     pluralize,
+    serialize_dataframe,
     set_classname,
     singularize,
     to_human_time_delta,
@@ -16,6 +22,14 @@ CLASSNAMEWITHOUTCLASS1 = "class3 class2"
 CLASS1 = "class1"
 CLASS4 = "class4"
 
+CSV_CONTENTS = "data:text/csv;base64," + base64.b64encode(b"x,y\n1,4\n2,5\n3,6\n").decode()
+
+_parquet_buffer = io.BytesIO()
+pl.DataFrame({"x": [1, 2, 3], "y": [4, 5, 6]}).write_parquet(_parquet_buffer)
+PARQUET_CONTENTS = (
+    "data:application/octet-stream;base64," + base64.b64encode(_parquet_buffer.getvalue()).decode()
+)
+
 
 @pytest.mark.test_utilities
 class TestSetClassname:
@@ -73,6 +87,42 @@ class TestPluralizeAndSingularize:
         assert singularize("an", -1) == "-1"
 
 
+@pytest.mark.test_utilities
+class TestConvertToDataframe:
+    """Tests for the convert_to_dataframe function."""
+
+    def test_parses_csv_contents(self) -> None:
+        """Test that valid csv contents is parsed."""
+        df = convert_to_dataframe(CSV_CONTENTS)
+        assert df.columns == ["x", "y"]
+        assert df.shape == (3, 2)
+
+    def test_parses_parquet_contents(self) -> None:
+        """Test that parquet uploads are detected by magic bytes."""
+        df = convert_to_dataframe(PARQUET_CONTENTS)
+        assert df.columns == ["x", "y"]
+        assert df.shape == (3, 2)
+
+    def test_column_projection(self) -> None:
+        """Test that only the projected columns are materialized."""
+        df = convert_to_dataframe(CSV_CONTENTS, columns=("x",))
+        assert df.columns == ["x"]
+
+    def test_repeated_contents_is_cached(self) -> None:
+        """Test that parsing identical contents twice hits the cache."""
+        assert convert_to_dataframe(CSV_CONTENTS) is convert_to_dataframe(CSV_CONTENTS)
+
+
+@pytest.mark.test_utilities
+class TestDataframeSerialization:
+    """Tests for the dataframe serialization helpers."""
+
+    def test_round_trip(self) -> None:
+        """Test that a dataframe survives a serialization round trip."""
+        df = convert_to_dataframe(CSV_CONTENTS)
+        assert deserialize_dataframe(serialize_dataframe(df)).frame_equal(df)
+
+
 @pytest.mark.test_utilities
 class TestToHumanTimeDelta:
     """Tests for the to_human_time_delta function."""